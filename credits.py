@@ -13,8 +13,9 @@ Think of this as a "credit usage detective" - it finds out exactly:
 - Which voices were used
 - How much your conversational AI calls cost
 
-The results are automatically saved to JSON files (a computer-readable format)
-and also printed to your screen so you can see them immediately.
+The results are automatically saved to JSON files (a computer-readable format),
+and a short summary is printed to your screen. Use --stdout to also print the
+full JSON results (handy for piping them into other tools).
 
 HOW TO USE THIS SCRIPT:
     python credits.py <start_time> <end_time>
@@ -26,12 +27,14 @@ HOW TO USE THIS SCRIPT:
 WHAT YOU NEED BEFORE RUNNING:
     1. Your ElevenLabs API key (get this from your ElevenLabs dashboard)
     2. Set it as an environment variable: export ELEVEN_API_STATS="your-key-here"
-    3. Python 3.7+ and the 'elevenlabs' package installed (pip install elevenlabs)
+    3. Python 3.7+ and the 'elevenlabs', 'orjson' and 'aiohttp' packages installed
+       (pip install elevenlabs orjson aiohttp)
 
 WHAT FILES GET CREATED:
     - api_stats_<timestamp>.json: Automatic file with all your data
     - Custom filename if you use --output option
     - Both contain the same information in JSON format
+    - With --gzip, both files are compressed and get a .gz ending (e.g. .json.gz)
 
 EXAMPLE USAGE:
     export ELEVEN_API_STATS="sk-your-key-here"
@@ -41,15 +44,63 @@ EXAMPLE USAGE:
 
 # Import statements - these load the tools our script needs to work
 import argparse  # Helps us handle command-line arguments (like start/end times)
-import json      # Helps us work with JSON data format
+import asyncio   # Lets us wait on many network requests at the same time
+import bisect    # Quickly finds positions in sorted lists (binary search)
+import functools # Lets us remember (cache) results of slow functions
+import gzip      # Lets us compress output files so they take up less space
+import operator  # Fast helpers for pulling values out of dictionaries
 import os        # Helps us access environment variables (like API keys)
 import sys       # Helps us exit the program if something goes wrong
+import threading # Lets us keep progress messages tidy while fetching in parallel
 import time      # Helps us work with timestamps and current time
-from datetime import datetime    # Helps us convert timestamps to readable dates
+from collections import defaultdict  # A dictionary that fills in missing keys for us
+from concurrent.futures import ThreadPoolExecutor  # Runs several fetches at the same time
 from typing import Dict, List, Any, Optional  # Helps with code documentation
 
+import aiohttp   # Makes many web requests at once (used for conversation details)
+import httpx     # The web library the ElevenLabs package uses under the hood
+import orjson    # A fast library for turning our data into JSON format
 from elevenlabs import ElevenLabs  # The official ElevenLabs Python library
 
+# HTTP/2 lets many requests share one connection, but it needs the optional
+# 'h2' package (pip install 'httpx[http2]'). Without it we just use HTTP/1.1.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Where the ElevenLabs REST API lives (used for requests we make ourselves, if the
+# client doesn't tell us its own configured address)
+ELEVENLABS_API_BASE = "https://api.elevenlabs.io"
+
+# How many conversation detail requests we allow "in flight" at the same time
+DETAIL_FETCH_CONCURRENCY = 32
+
+# How many times we try a conversation detail request before giving up, and the
+# starting wait (in seconds) between tries - it doubles after every failed try
+DETAIL_FETCH_MAX_ATTEMPTS = 5
+DETAIL_FETCH_BACKOFF_SECS = 0.5
+
+# The longest server-requested wait ("Retry-After") we're willing to honour
+DETAIL_FETCH_MAX_RETRY_AFTER_SECS = 60.0
+
+# Only one thread may print at a time, so progress lines don't get mixed together
+_print_lock = threading.Lock()
+
+
+def safe_print(*args: Any, **kwargs: Any) -> None:
+    """
+    Print a message without it getting jumbled up with messages from other threads.
+    
+    BEGINNER EXPLANATION:
+    We fetch several kinds of data at the same time (in "threads"). If two threads
+    print at the exact same moment, their text can get mixed together. This works
+    just like print(), but makes threads take turns.
+    """
+    with _print_lock:
+        print(*args, **kwargs)
+
 
 def normalize_timestamp(timestamp: int) -> int:
     """
@@ -74,6 +125,23 @@ def normalize_timestamp(timestamp: int) -> int:
     return timestamp  # Already in milliseconds
 
 
+@functools.lru_cache(maxsize=65536)
+def _fmt_sec(timestamp_sec: int) -> str:
+    """
+    Format a whole-second Unix timestamp, remembering results we've already computed.
+    
+    BEGINNER EXPLANATION:
+    Many API calls happen in the same second (for example batch jobs), so we
+    keep a cache of recently formatted times and reuse them instead of doing
+    the same date conversion over and over.
+    """
+    # time.gmtime gives us the date parts in UTC, matching the "UTC" suffix we
+    # append. Building the string ourselves is faster than strftime.
+    t = time.gmtime(timestamp_sec)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d} UTC")
+
+
 def format_timestamp(timestamp_ms: int) -> str:
     """
     Convert a timestamp in milliseconds to a human-readable date string.
@@ -89,10 +157,34 @@ def format_timestamp(timestamp_ms: int) -> str:
     Returns:
         A nicely formatted date string like "2023-01-15 14:30:00 UTC"
     """
-    # Convert milliseconds to seconds, then to a UTC datetime object, then to string
-    # Using utcfromtimestamp ensures the time is correctly represented in UTC,
-    # aligning with the "UTC" suffix we append to the formatted string.
-    return datetime.utcfromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S UTC')
+    # The formatted string only shows whole seconds, so drop the milliseconds
+    # before looking it up in the cache (this makes cache hits much more likely)
+    return _fmt_sec(timestamp_ms // 1000)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Tell orjson how to save objects it doesn't know about.
+    
+    BEGINNER EXPLANATION:
+    The ElevenLabs library gives us its data as "Pydantic models" (special Python
+    objects). Rather than converting each one to a dictionary as soon as we get it,
+    we keep the original objects and only convert them here, while saving the JSON.
+    
+    Args:
+        obj: An object orjson couldn't convert on its own
+        
+    Returns:
+        A plain dictionary version of the object
+    """
+    # Prefer .dict(): the ElevenLabs models customize it to use the API's field
+    # names and skip fields that were never set, which keeps our output the same
+    # as the API's. model_dump() is the fallback for other Pydantic v2 objects.
+    if hasattr(obj, 'dict'):
+        return obj.dict()
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump(by_alias=True, exclude_unset=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def calculate_credits_used(item: Any) -> int:
@@ -110,11 +202,12 @@ def calculate_credits_used(item: Any) -> int:
     Returns:
         Number of credits used for this API call
     """
-    # Check if the item has character count information
-    if hasattr(item, 'character_count_change_from') and hasattr(item, 'character_count_change_to'):
+    try:
         # Credits used = starting count - ending count
         return item.character_count_change_from - item.character_count_change_to
-    return 0  # If we can't calculate it, assume 0
+    except (AttributeError, TypeError):
+        # The counts are missing (or empty), so we can't calculate it - assume 0
+        return 0
 
 
 def get_speech_history(client: ElevenLabs, start_ms: int, end_ms: int) -> List[Dict[str, Any]]:
@@ -137,9 +230,19 @@ def get_speech_history(client: ElevenLabs, start_ms: int, end_ms: int) -> List[D
     Returns:
         List of dictionaries, each containing details about one speech generation call
     """
-    print("📜 Fetching speech generation history...")
-    
-    all_history = []  # This will store all our API call data
+    safe_print("📜 Fetching speech generation history...")
+    
+    # This will store all our API call data. A plain list is the right choice here:
+    # each page is added with a single extend() (which makes room for the whole
+    # page in one go), and main() later joins it with the conversation history
+    # and sorts the combined list by timestamp.
+    all_history = []
+    
+    # History items carry whole-second timestamps, so we compare in seconds.
+    # Rounding the start up and the end down keeps exactly the same items as
+    # comparing the millisecond values would.
+    start_sec = -(-start_ms // 1000)
+    end_sec = end_ms // 1000
     page_size = 1000  # How many items to fetch per request (1000 is the maximum)
     start_after_id = None  # Used for pagination - like a bookmark in the data
     
@@ -156,41 +259,56 @@ def get_speech_history(client: ElevenLabs, start_ms: int, end_ms: int) -> List[D
             if not response.history:
                 break
                 
-            # Look at each item in this page
-            for item in response.history:
-                item_time_ms = item.date_unix * 1000  # Convert to milliseconds
-                
-                # Only include items within our time range
-                if start_ms <= item_time_ms <= end_ms:
-                    credits_used = calculate_credits_used(item)
-                    
-                    # Create a dictionary with all the important information
-                    call_data = {
-                        "type": "speech_generation",  # What kind of API call this was
-                        "id": item.history_item_id,   # Unique identifier
-                        "timestamp": item.date_unix,  # When it happened (seconds)
-                        "timestamp_ms": item_time_ms, # When it happened (milliseconds)
-                        "formatted_time": format_timestamp(item_time_ms),  # Human-readable time
-                        "credits_used": credits_used, # How many credits it cost
-                        "text": item.text,           # The text that was converted to speech
-                        "voice_id": item.voice_id,   # Which voice was used (ID)
-                        "voice_name": item.voice_name, # Which voice was used (name)
-                        "voice_category": str(item.voice_category) if item.voice_category else None,
-                        "model_id": item.model_id,   # Which AI model was used
-                        "content_type": item.content_type,  # File format (like mp3)
-                        "source": str(item.source) if item.source else None,  # How the call was made
-                        "character_count_from": item.character_count_change_from,  # Credits before
-                        "character_count_to": item.character_count_change_to,    # Credits after
-                        "request_id": item.request_id,  # Technical ID for debugging
-                        "settings": item.settings,      # Voice settings used
-                        "feedback": item.feedback.dict() if item.feedback else None,  # Any feedback given
-                    }
-                    all_history.append(call_data)
+            # History is ordered newest to oldest, so the items inside our time
+            # range form one continuous block of the page. We find where that
+            # block starts and ends with a binary search ("bisect") instead of
+            # checking every item. Timestamps are negated so the list goes from
+            # smallest to largest, which is the order bisect expects.
+            page = response.history
+            negated_times = [-item.date_unix for item in page]
+            first_in_range = bisect.bisect_left(negated_times, -end_sec)
+            past_range = bisect.bisect_right(negated_times, -start_sec)
+            
+            # Collect this page's results separately, then add them all at once
+            page_items = []
+            
+            # Look at each item in this page that falls within our time range
+            for item in page[first_in_range:past_range]:
+                ts_sec = item.date_unix  # When it happened (seconds)
+                credits_used = calculate_credits_used(item)
                 
-                # If this item is older than our start time, we can stop fetching
-                # (since history is ordered newest to oldest)
-                elif item_time_ms < start_ms:
-                    return all_history
+                # Create a dictionary with all the important information
+                # (Python builds a literal like this with fixed keys in a single
+                # fast step, so it's quicker than tricks like dict(zip(keys, values)))
+                # Some fields may come back as "enum" objects - getattr(x, "value", x)
+                # takes their plain text value, and leaves strings and None untouched
+                call_data = {
+                    "type": "speech_generation",  # What kind of API call this was
+                    "id": item.history_item_id,   # Unique identifier
+                    "timestamp": ts_sec,          # When it happened (seconds)
+                    "timestamp_ms": ts_sec * 1000, # When it happened (milliseconds)
+                    "formatted_time": _fmt_sec(ts_sec),  # Human-readable time
+                    "credits_used": credits_used, # How many credits it cost
+                    "text": item.text,           # The text that was converted to speech
+                    "voice_id": item.voice_id,   # Which voice was used (ID)
+                    "voice_name": item.voice_name, # Which voice was used (name)
+                    "voice_category": getattr(item.voice_category, "value", item.voice_category),
+                    "model_id": item.model_id,   # Which AI model was used
+                    "content_type": item.content_type,  # File format (like mp3)
+                    "source": getattr(item.source, "value", item.source),  # How the call was made
+                    "character_count_from": item.character_count_change_from,  # Credits before
+                    "character_count_to": item.character_count_change_to,    # Credits after
+                    "request_id": item.request_id,  # Technical ID for debugging
+                    "settings": item.settings,      # Voice settings used
+                    "feedback": item.feedback,      # Any feedback given (converted when saving)
+                }
+                page_items.append(call_data)
+            all_history.extend(page_items)
+            
+            # If this page reaches items older than our start time, we can stop fetching
+            # (since history is ordered newest to oldest)
+            if past_range < len(page):
+                return all_history
             
             # Check if there are more pages to fetch
             if not response.has_more:
@@ -198,16 +316,149 @@ def get_speech_history(client: ElevenLabs, start_ms: int, end_ms: int) -> List[D
                 
             # Set up to fetch the next page
             start_after_id = response.last_history_item_id
-            print(f"📄 Fetched {len(all_history)} speech generations so far...")
+            safe_print(f"📄 Fetched {len(all_history)} speech generations so far...")
             
         except Exception as e:
-            print(f"❌ Error fetching speech history: {e}")
+            safe_print(f"❌ Error fetching speech history: {e}")
             break
     
     return all_history
 
 
-def get_conversation_history(client: ElevenLabs, start_ms: int, end_ms: int) -> List[Dict[str, Any]]:
+def _api_base_url(client: ElevenLabs) -> str:
+    """
+    Find the web address the ElevenLabs client is configured to talk to.
+    
+    BEGINNER EXPLANATION:
+    The ElevenLabs library can be pointed at different servers (for example a
+    regional one). Our own requests should go to the same place, so we ask the
+    client for its address and only fall back to the default if we can't.
+    """
+    try:
+        return client._client_wrapper.get_base_url().rstrip("/")
+    except AttributeError:
+        return ELEVENLABS_API_BASE
+
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a failed request.
+    
+    BEGINNER EXPLANATION:
+    When the server is busy it may tell us how long to wait with a "Retry-After"
+    header, so we use that if it's there (up to a one minute limit). Otherwise we wait a little longer after
+    every failed try ("exponential backoff").
+    """
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after:
+        try:
+            # Don't let one huge value stall the whole run - above the cap we
+            # fall back to our own backoff instead
+            delay = float(retry_after)
+            if 0.0 <= delay <= DETAIL_FETCH_MAX_RETRY_AFTER_SECS:
+                return delay
+        except ValueError:
+            pass  # Not a number of seconds (e.g. a date) - use our own backoff
+    return DETAIL_FETCH_BACKOFF_SECS * (2 ** attempt)
+
+
+async def _fetch_conv_detail(session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+    """
+    Download the full details of a single conversation.
+    
+    BEGINNER EXPLANATION:
+    This is an "async" function - instead of sitting idle while waiting for the
+    server to answer, Python can start other requests in the meantime.
+    
+    If the server says we're sending too many requests (429), has a temporary
+    problem (5xx), or the connection drops, we wait and try again a few times.
+    Giving up too early would record the conversation as costing 0 credits.
+    
+    Args:
+        session: Shared aiohttp session (reuses connections, sends the API key)
+        url: Address of the conversation to fetch
+        
+    Returns:
+        The conversation details as a dictionary (parsed from JSON)
+    """
+    for attempt in range(DETAIL_FETCH_MAX_ATTEMPTS):
+        is_last_attempt = attempt == DETAIL_FETCH_MAX_ATTEMPTS - 1
+        try:
+            async with session.get(url) as resp:
+                if (resp.status == 429 or resp.status >= 500) and not is_last_attempt:
+                    delay = _retry_delay(resp, attempt)
+                else:
+                    resp.raise_for_status()  # Turn HTTP errors (404, 500, ...) into exceptions
+                    # Read the raw bytes and parse them with orjson rather than resp.json(),
+                    # which uses Python's slower built-in json module. Full transcripts can be
+                    # megabytes in size, so this matters.
+                    return orjson.loads(await resp.read())
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if is_last_attempt:
+                raise
+            delay = DETAIL_FETCH_BACKOFF_SECS * (2 ** attempt)
+        await asyncio.sleep(delay)
+    raise RuntimeError("unreachable")  # The last attempt always returns or raises
+
+
+async def _open_detail_session(api_key: str) -> aiohttp.ClientSession:
+    """
+    Open the web session used for all conversation detail requests.
+    
+    BEGINNER EXPLANATION:
+    A session keeps network connections open so later requests can reuse them
+    instead of connecting (and doing the secure "handshake") all over again.
+    We open it once and use it for every page of conversations.
+    
+    Args:
+        api_key: Your ElevenLabs API key (sent with every request)
+        
+    Returns:
+        An open aiohttp session - close it with "await session.close()" when done
+    """
+    connector = aiohttp.TCPConnector(limit=DETAIL_FETCH_CONCURRENCY)
+    # trust_env=True makes us respect proxy settings (like HTTPS_PROXY) just
+    # like the ElevenLabs library does
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"xi-api-key": api_key},
+        trust_env=True
+    )
+
+
+async def _gather_details(session: aiohttp.ClientSession, conv_ids: List[str], base_url: str) -> List[Any]:
+    """
+    Download the details of many conversations at the same time.
+    
+    BEGINNER EXPLANATION:
+    Fetching conversations one after another means waiting for every single
+    round-trip to the server. Here we send up to DETAIL_FETCH_CONCURRENCY
+    requests at once, which is much faster when there are lots of conversations.
+    
+    Args:
+        session: Open session from _open_detail_session
+        conv_ids: IDs of the conversations to fetch
+        base_url: Address of the ElevenLabs API (e.g. "https://api.elevenlabs.io")
+        
+    Returns:
+        One entry per ID, in the same order: either the details dictionary,
+        or the exception that happened while fetching it
+    """
+    semaphore = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)  # Caps requests in flight
+    
+    async def fetch_one(conv_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            url = f"{base_url}/v1/convai/conversations/{conv_id}"
+            return await _fetch_conv_detail(session, url)
+    
+    # return_exceptions=True means one failed conversation doesn't cancel the others
+    return await asyncio.gather(
+        *[fetch_one(conv_id) for conv_id in conv_ids],
+        return_exceptions=True
+    )
+
+
+def get_conversation_history(client: ElevenLabs, api_key: str, start_ms: int, end_ms: int) -> List[Dict[str, Any]]:
     """
     Download all conversational AI history within the time period.
     
@@ -217,27 +468,37 @@ def get_conversation_history(client: ElevenLabs, start_ms: int, end_ms: int) ->
     conversations, including how much they cost and how long they lasted.
     
     This is more complex than speech generation because we need to fetch detailed
-    information about each conversation individually.
+    information about each conversation individually. Those detail requests are
+    sent concurrently (see _gather_details) to keep things fast.
     
     Args:
         client: Connected ElevenLabs API client
+        api_key: Your ElevenLabs API key (used for the concurrent detail requests)
         start_ms: Start time in milliseconds  
         end_ms: End time in milliseconds
         
     Returns:
         List of dictionaries, each containing details about one conversation
     """
-    print("🗣️  Fetching conversational AI history...")
+    safe_print("🗣️  Fetching conversational AI history...")
+    
+    # One event loop and one web session are shared by every page, so the
+    # connections opened for the first page's details are reused by later pages
+    loop = asyncio.new_event_loop()
+    session = None
     
     try:
         all_conversations = []  # Store all conversation data here
         cursor = None          # Used for pagination (like a bookmark)
         page_size = 100        # How many conversations to fetch per request
+        base_url = _api_base_url(client)  # Send detail requests to the same server as the client
         
         # Convert milliseconds back to seconds for this specific API
         start_unix_secs = start_ms // 1000
         end_unix_secs = end_ms // 1000
         
+        session = loop.run_until_complete(_open_detail_session(api_key))
+        
         # Keep fetching pages until we have all conversations
         while True:
             # Get a page of conversations
@@ -251,85 +512,111 @@ def get_conversation_history(client: ElevenLabs, start_ms: int, end_ms: int) ->
             # If no conversations on this page, we're done
             if not response.conversations:
                 break
+            
+            # Fetch detailed information for every conversation on this page at once
+            conv_ids = [conversation.conversation_id for conversation in response.conversations]
+            details = loop.run_until_complete(_gather_details(session, conv_ids, base_url))
                 
-            # For each conversation, get detailed information
-            for conversation in response.conversations:
+            # Collect this page's results separately, then add them all at once
+            page_items = []
+            
+            # For each conversation, combine the summary with its detailed information
+            for conversation, detailed_conv in zip(response.conversations, details):
                 try:
-                    # Fetch detailed data for this specific conversation
-                    detailed_conv = client.conversational_ai.conversations.get(
-                        conversation_id=conversation.conversation_id
-                    )
+                    # If fetching the details failed, handle it like any other error below
+                    if isinstance(detailed_conv, BaseException):
+                        raise detailed_conv
+                    
+                    metadata = detailed_conv.get("metadata") or {}
+                    transcript = detailed_conv.get("transcript") or []
                     
                     # Calculate total cost and token usage
                     total_cost = 0
                     total_llm_tokens = 0
                     
                     # Get the cost if available
-                    if detailed_conv.metadata.cost:
-                        total_cost = detailed_conv.metadata.cost
+                    if metadata.get("cost"):
+                        total_cost = metadata["cost"]
                     
-                    # Sum up language model usage from the conversation transcript
-                    for transcript_item in detailed_conv.transcript:
-                        if hasattr(transcript_item, 'llm_usage') and transcript_item.llm_usage:
-                            if hasattr(transcript_item.llm_usage, 'total_tokens'):
-                                total_llm_tokens += transcript_item.llm_usage.total_tokens
+                    # Walk the transcript once: count messages by role and
+                    # sum up language model usage at the same time
+                    user_messages = 0
+                    assistant_messages = 0
+                    for transcript_item in transcript:
+                        role = transcript_item.get("role")
+                        if role == "user":
+                            user_messages += 1
+                        elif role == "assistant":
+                            assistant_messages += 1
+                        
+                        llm_usage = transcript_item.get("llm_usage")
+                        if llm_usage and llm_usage.get("total_tokens"):
+                            total_llm_tokens += llm_usage["total_tokens"]
                     
                     # Create a dictionary with all conversation information
+                    conv_start_sec = metadata["start_time_unix_secs"]
                     conv_data = {
                         "type": "conversational_ai",  # Type of API call
                         "id": conversation.conversation_id,  # Unique ID
                         "agent_id": conversation.agent_id,   # Which AI agent was used
-                        "timestamp": detailed_conv.metadata.start_time_unix_secs,  # When it started
-                        "timestamp_ms": detailed_conv.metadata.start_time_unix_secs * 1000,  # In milliseconds
-                        "formatted_time": format_timestamp(detailed_conv.metadata.start_time_unix_secs * 1000),
+                        "timestamp": conv_start_sec,  # When it started
+                        "timestamp_ms": conv_start_sec * 1000,  # In milliseconds
+                        "formatted_time": _fmt_sec(conv_start_sec),
                         "credits_used": total_cost,  # How many credits it cost
-                        "duration_secs": detailed_conv.metadata.call_duration_secs,  # How long it lasted
-                        "status": str(conversation.status),  # Success, failed, etc.
+                        "duration_secs": metadata.get("call_duration_secs"),  # How long it lasted
+                        "status": getattr(conversation.status, "value", conversation.status),  # Success, failed, etc.
                         "total_llm_tokens": total_llm_tokens,  # Language model usage
-                        "accepted_time": detailed_conv.metadata.accepted_time_unix_secs,  # When call was answered
-                        "termination_reason": detailed_conv.metadata.termination_reason,  # Why call ended
-                        "main_language": detailed_conv.metadata.main_language,  # Primary language used
-                        "charging_info": detailed_conv.metadata.charging.dict() if detailed_conv.metadata.charging else None,
-                        "phone_call_info": detailed_conv.metadata.phone_call.dict() if detailed_conv.metadata.phone_call else None,
-                        "error_info": detailed_conv.metadata.error.dict() if detailed_conv.metadata.error else None,
+                        "accepted_time": metadata.get("accepted_time_unix_secs"),  # When call was answered
+                        "termination_reason": metadata.get("termination_reason"),  # Why call ended
+                        "main_language": metadata.get("main_language"),  # Primary language used
+                        "charging_info": metadata.get("charging"),
+                        "phone_call_info": metadata.get("phone_call"),
+                        "error_info": metadata.get("error"),
                         "transcript_summary": {
-                            "total_items": len(detailed_conv.transcript),
-                            "user_messages": len([t for t in detailed_conv.transcript if t.role == "user"]),
-                            "assistant_messages": len([t for t in detailed_conv.transcript if t.role == "assistant"]),
+                            "total_items": len(transcript),
+                            "user_messages": user_messages,
+                            "assistant_messages": assistant_messages,
                         }
                     }
-                    all_conversations.append(conv_data)
+                    page_items.append(conv_data)
                     
                 except Exception as e:
                     # If we can't get detailed info, save basic info with error note
-                    print(f"⚠️  Warning: Could not get details for conversation {conversation.conversation_id}: {e}")
+                    safe_print(f"⚠️  Warning: Could not get details for conversation {conversation.conversation_id}: {e}")
                     conv_data = {
                         "type": "conversational_ai",
                         "id": conversation.conversation_id,
                         "agent_id": conversation.agent_id,
                         "timestamp": conversation.start_time_unix_secs,
                         "timestamp_ms": conversation.start_time_unix_secs * 1000,
-                        "formatted_time": format_timestamp(conversation.start_time_unix_secs * 1000),
+                        "formatted_time": _fmt_sec(conversation.start_time_unix_secs),
                         "credits_used": 0,
                         "duration_secs": conversation.call_duration_secs,
-                        "status": str(conversation.status),
+                        "status": getattr(conversation.status, "value", conversation.status),
                         "error": f"Could not fetch detailed data: {e}"
                     }
-                    all_conversations.append(conv_data)
+                    page_items.append(conv_data)
+            all_conversations.extend(page_items)
             
             # Check if there are more pages
             if not hasattr(response, 'cursor') or not response.cursor:
                 break
                 
             cursor = response.cursor
-            print(f"📞 Fetched {len(all_conversations)} conversations so far...")
+            safe_print(f"📞 Fetched {len(all_conversations)} conversations so far...")
         
         return all_conversations
         
     except Exception as e:
         # If conversational AI features aren't available, that's okay
-        print(f"⚠️  Note: Could not fetch conversational AI data (might not be available): {e}")
+        safe_print(f"⚠️  Note: Could not fetch conversational AI data (might not be available): {e}")
         return []
+    
+    finally:
+        # Close the network connections and the event loop we opened above
+        if session is not None:
+            loop.run_until_complete(session.close())
+        loop.close()
 
 
 def get_usage_analytics(client: ElevenLabs, start_ms: int, end_ms: int) -> Dict[str, Any]:
@@ -349,7 +636,7 @@ def get_usage_analytics(client: ElevenLabs, start_ms: int, end_ms: int) -> Dict[
     Returns:
         Dictionary containing usage analytics data
     """
-    print("📊 Fetching usage analytics...")
+    safe_print("📊 Fetching usage analytics...")
     
     try:
         # Convert millisecond timestamps back to seconds as required by the API
@@ -366,11 +653,11 @@ def get_usage_analytics(client: ElevenLabs, start_ms: int, end_ms: int) -> Dict[
         )
         
         return {
-            "usage_analytics": analytics.dict() if hasattr(analytics, 'dict') else str(analytics),
+            "usage_analytics": analytics if hasattr(analytics, 'dict') else str(analytics),
             "fetched_at": format_timestamp(int(time.time() * 1000))  # When we got this data
         }
     except Exception as e:
-        print(f"⚠️  Warning: Could not fetch usage analytics: {e}")
+        safe_print(f"⚠️  Warning: Could not fetch usage analytics: {e}")
         return {"error": str(e)}
 
 
@@ -394,7 +681,7 @@ def get_subscription_info(client: ElevenLabs) -> Dict[str, Any]:
     Returns:
         Dictionary containing subscription and usage information
     """
-    print("💳 Fetching subscription information...")
+    safe_print("💳 Fetching subscription information...")
     
     try:
         # Get user account information from the API
@@ -407,13 +694,13 @@ def get_subscription_info(client: ElevenLabs) -> Dict[str, Any]:
             "character_count_used": subscription.character_count,  # Credits used this cycle
             "character_limit": subscription.character_limit,       # Total credits per cycle
             "next_reset_unix": subscription.next_character_count_reset_unix,  # When credits reset
-            "next_reset_formatted": format_timestamp(subscription.next_character_count_reset_unix * 1000) if subscription.next_character_count_reset_unix else None,
+            "next_reset_formatted": _fmt_sec(subscription.next_character_count_reset_unix) if subscription.next_character_count_reset_unix else None,
             "voice_slots_used": subscription.voice_slots_used,     # Custom voices you've made
             "voice_limit": subscription.voice_limit,               # Max custom voices allowed
             "professional_voice_slots_used": subscription.professional_voice_slots_used,  # Pro voices
             "professional_voice_limit": subscription.professional_voice_limit,            # Max pro voices
-            "status": str(subscription.status),  # Active, cancelled, etc.
-            "currency": str(subscription.currency) if subscription.currency else None,  # Billing currency
+            "status": getattr(subscription.status, "value", subscription.status),  # Active, cancelled, etc.
+            "currency": getattr(subscription.currency, "value", subscription.currency),  # Billing currency
         }
         
         # Add detailed usage information if available
@@ -433,7 +720,7 @@ def get_subscription_info(client: ElevenLabs) -> Dict[str, Any]:
         return subscription_data
         
     except Exception as e:
-        print(f"⚠️  Warning: Could not fetch subscription info: {e}")
+        safe_print(f"⚠️  Warning: Could not fetch subscription info: {e}")
         return {"error": str(e)}
 
 
@@ -456,54 +743,83 @@ def summarize_usage(all_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
         all_calls: List of all API calls (both speech and conversational AI)
         
     Returns:
-        Dictionary containing various usage summaries
+        Dictionary containing various usage summaries (only plain dictionaries,
+        numbers and strings, so it can be saved as JSON without any conversion)
     """
-    # Calculate total credits used across all calls
-    total_credits = sum(call.get("credits_used", 0) for call in all_calls)
-    
-    # Group calls by type (speech generation vs conversational AI)
-    by_type = {}
+    # Running totals, filled in by a single pass over all the calls below.
+    # A defaultdict creates the {"count": 0, "credits": 0} entry the first time
+    # we see a new key, so we don't need to check for it ourselves.
+    total_credits = 0
+    by_type = defaultdict(lambda: {"count": 0, "credits": 0})    # Speech generation vs conversational AI
+    by_source = defaultdict(lambda: {"count": 0, "credits": 0})  # Web app, API, mobile app, etc.
+    by_voice = defaultdict(lambda: {"count": 0, "credits": 0})   # Which voice was used
+    earliest_ts = None  # Oldest call timestamp (seconds)
+    latest_ts = None    # Newest call timestamp (seconds)
+    
+    # Look at each call just once and update every summary at the same time
     for call in all_calls:
+        credits = call.get("credits_used", 0)
+        total_credits += credits
+        
         call_type = call["type"]
-        if call_type not in by_type:
-            by_type[call_type] = {"count": 0, "credits": 0}
-        by_type[call_type]["count"] += 1
-        by_type[call_type]["credits"] += call.get("credits_used", 0)
-    
-    # Group speech generation calls by source (web app, API, mobile app, etc.)
-    by_source = {}
-    for call in all_calls:
-        if call["type"] == "speech_generation" and call.get("source"):
-            source = call["source"]
-            if source not in by_source:
-                by_source[source] = {"count": 0, "credits": 0}
-            by_source[source]["count"] += 1
-            by_source[source]["credits"] += call.get("credits_used", 0)
-    
-    # Group speech generation calls by voice used
-    by_voice = {}
-    for call in all_calls:
-        if call["type"] == "speech_generation" and call.get("voice_name"):
-            voice = call["voice_name"]
-            if voice not in by_voice:
-                by_voice[voice] = {"count": 0, "credits": 0}
-            by_voice[voice]["count"] += 1
-            by_voice[voice]["credits"] += call.get("credits_used", 0)
+        type_stats = by_type[call_type]
+        type_stats["count"] += 1
+        type_stats["credits"] += credits
+        
+        # Source and voice breakdowns only apply to speech generation calls
+        if call_type == "speech_generation":
+            source = call.get("source")
+            if source:
+                by_source[source]["count"] += 1
+                by_source[source]["credits"] += credits
+            voice = call.get("voice_name")
+            if voice:
+                by_voice[voice]["count"] += 1
+                by_voice[voice]["credits"] += credits
+        
+        # Comparing numbers is faster than comparing formatted date strings
+        timestamp = call["timestamp"]
+        if earliest_ts is None or timestamp < earliest_ts:
+            earliest_ts = timestamp
+        if latest_ts is None or timestamp > latest_ts:
+            latest_ts = timestamp
     
     # Create and return the complete summary
     return {
         "total_api_calls": len(all_calls),
         "total_credits_used": total_credits,
-        "breakdown_by_type": by_type,
-        "breakdown_by_source": by_source,
-        "breakdown_by_voice": by_voice,
+        "breakdown_by_type": dict(by_type),
+        "breakdown_by_source": dict(by_source),
+        "breakdown_by_voice": dict(by_voice),
         "time_range": {
-            "earliest_call": min(call["formatted_time"] for call in all_calls) if all_calls else None,
-            "latest_call": max(call["formatted_time"] for call in all_calls) if all_calls else None,
+            "earliest_call": _fmt_sec(earliest_ts) if earliest_ts is not None else None,
+            "latest_call": _fmt_sec(latest_ts) if latest_ts is not None else None,
         }
     }
 
 
+def write_output_file(path: str, data: bytes, compress: bool = False) -> None:
+    """
+    Save the JSON results to a file, optionally compressed with gzip.
+    
+    BEGINNER EXPLANATION:
+    JSON reports repeat the same field names over and over, so they shrink a lot
+    when compressed. We use the fastest gzip level (1), which still makes the
+    file much smaller while barely slowing things down.
+    
+    Args:
+        path: Where to save the file
+        data: The JSON results (already converted to bytes)
+        compress: Whether to gzip-compress the file
+    """
+    if compress:
+        with gzip.open(path, 'wb', compresslevel=1) as f:
+            f.write(data)
+    else:
+        with open(path, 'wb') as f:
+            f.write(data)
+
+
 def main():
     """
     Main function that runs when the script is executed.
@@ -514,7 +830,7 @@ def main():
     2. Sets up the connection to ElevenLabs
     3. Fetches all the data from various APIs
     4. Creates summaries and saves results to files
-    5. Prints everything to your screen
+    5. Prints a summary (and, with --stdout, the full results) to your screen
     
     Think of this as the "conductor" that directs all the other functions.
     """
@@ -530,6 +846,8 @@ def main():
     parser.add_argument("--output", "-o", help="Additional output file (automatic timestamped file always created)")
     parser.add_argument("--pretty", action="store_true", help="Pretty print JSON output")
     parser.add_argument("--summary-only", action="store_true", help="Show only summary, not individual calls")
+    parser.add_argument("--stdout", action="store_true", help="Also print the full JSON results to standard output")
+    parser.add_argument("--gzip", action="store_true", help="Compress saved JSON files with gzip (adds .gz to the filenames)")
     
     # Parse the arguments the user provided
     args = parser.parse_args()
@@ -555,6 +873,12 @@ def main():
     # This ensures each run creates a unique file with a timestamp
     current_timestamp = int(time.time())
     auto_filename = f"api_stats_{current_timestamp}.json"
+    if args.gzip:
+        # Compressed files get the usual .gz ending, so other tools don't
+        # mistake them for plain JSON
+        auto_filename += ".gz"
+        if args.output and not args.output.endswith(".gz"):
+            args.output += ".gz"
     
     # Print information about what we're about to do
     print(f"🔍 Analyzing ElevenLabs usage from {format_timestamp(start_ms)} to {format_timestamp(end_ms)}")
@@ -564,22 +888,46 @@ def main():
     
     # Try to connect to the ElevenLabs API
     try:
-        client = ElevenLabs(api_key=api_key)
+        # Share one pool of kept-alive connections across the requests the
+        # ElevenLabs library makes (listing history and conversations, account
+        # and usage info). Conversation details are fetched separately with aiohttp.
+        # The timeout and redirect settings match the library's own defaults:
+        # without them httpx would give up after 5 seconds (a large history page
+        # can take longer than that) and would refuse to follow redirects.
+        http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(240.0),
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        client = ElevenLabs(api_key=api_key, httpx_client=http_client)
         print("✅ Connected to ElevenLabs API")
     except Exception as e:
         print(f"❌ Error connecting to ElevenLabs: {e}")
         sys.exit(1)
     
     # Gather all the data from different ElevenLabs APIs
-    # Each function handles a different type of data
-    subscription_info = get_subscription_info(client)
-    speech_history = get_speech_history(client, start_ms, end_ms)
-    conversation_history = get_conversation_history(client, start_ms, end_ms)
-    usage_analytics = get_usage_analytics(client, start_ms, end_ms)
+    # Each function handles a different type of data. They talk to separate
+    # endpoints, so we run them at the same time instead of waiting for each in turn.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        subscription_future = executor.submit(get_subscription_info, client)
+        speech_future = executor.submit(get_speech_history, client, start_ms, end_ms)
+        conversation_future = executor.submit(get_conversation_history, client, api_key, start_ms, end_ms)
+        analytics_future = executor.submit(get_usage_analytics, client, start_ms, end_ms)
+        
+        subscription_info = subscription_future.result()
+        speech_history = speech_future.result()
+        conversation_history = conversation_future.result()
+        usage_analytics = analytics_future.result()
+    
+    # We're done talking to ElevenLabs, so close the shared connections cleanly
+    http_client.close()
     
     # Combine all API calls into one list and sort by time
+    # (Python's sort notices runs that are already in order - like the newest-first
+    # speech history - so this is close to a single pass over the data)
     all_calls = speech_history + conversation_history
-    all_calls.sort(key=lambda x: x["timestamp"])  # Sort chronologically
+    all_calls.sort(key=operator.itemgetter("timestamp"))  # Sort chronologically
     
     # Create a summary of all the usage data
     summary = summarize_usage(all_calls)
@@ -613,23 +961,28 @@ def main():
     
     # Convert the data to JSON format
     # Pretty-print if requested (makes it easier to read but larger file size)
-    json_output = json.dumps(output_data, indent=2 if args.pretty else None, ensure_ascii=False)
+    # orjson produces UTF-8 bytes directly, so we can write them without re-encoding
+    json_options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if args.pretty else 0)
+    json_bytes = orjson.dumps(output_data, default=_json_default, option=json_options)
     
     # Always save to the automatic timestamped file
-    with open(auto_filename, 'w', encoding='utf-8') as f:
-        f.write(json_output)
+    write_output_file(auto_filename, json_bytes, args.gzip)
     print(f"\n💾 Results automatically saved to {auto_filename}")
     
     # Also save to custom output file if the user specified one
+    # (the same bytes are reused, and we skip it if it's the file we just wrote)
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(json_output)
+        if os.path.abspath(args.output) != os.path.abspath(auto_filename):
+            write_output_file(args.output, json_bytes, args.gzip)
         print(f"💾 Results also saved to {args.output}")
     
-    # Always print the full results to standard output (the screen)
+    # Print the full results to standard output (the screen) if requested
     # This lets users pipe the output to other tools if needed
-    print("\n" + "="*80)
-    print(json_output)
+    if args.stdout:
+        print("\n" + "="*80)
+        sys.stdout.flush()  # Make sure the separator appears before the raw bytes
+        sys.stdout.buffer.write(json_bytes)
+        sys.stdout.buffer.write(b"\n")
 
 
 # This is a Python convention - only run main() if this script is executed directly